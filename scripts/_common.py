@@ -0,0 +1,41 @@
+"""
+Shared helpers for the governance scripts.
+
+Hosts the single compiled SemVer pattern and the memoised project-root
+lookup so each script stops carrying its own copy (and its own cold
+regex/cache state).
+"""
+import functools
+import os
+import re
+from pathlib import Path
+
+# fullmatch implies both anchors, and unlike $ it rejects a trailing newline
+SEMVER_RE = re.compile(r'\d+\.\d+\.\d+')
+
+
+def validate_semver(version: str) -> bool:
+    """Check if version matches SemVer format."""
+    return SEMVER_RE.fullmatch(version) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def find_project_root() -> Path:
+    """Find project root by looking for MODULE.bazel.
+
+    Memoised; a CI wrapper can also set PROJECT_ROOT to skip the walk.
+    """
+    env_root = os.environ.get("PROJECT_ROOT")
+    if env_root:
+        return Path(env_root)
+    current = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        try:
+            os.stat(os.path.join(current, "MODULE.bazel"))
+            return Path(current)
+        except FileNotFoundError:
+            pass
+        parent = os.path.dirname(current)
+        if parent == current:
+            raise FileNotFoundError("Could not find project root (MODULE.bazel)")
+        current = parent
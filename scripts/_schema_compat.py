@@ -0,0 +1,411 @@
+"""
+Shared helpers for schema compatibility checking.
+
+Imported by check-schema-compat.py so the diff/validation logic is parsed
+and byte-compiled once, and module-level caches (compiled regexes,
+find_project_root memoisation, the git-diff cache) are shared by every
+caller in the same process.
+"""
+import atexit
+import functools
+import json
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# Re-exported for check-schema-compat.py; the single compiled SemVer
+# pattern and memoised root lookup live in _common
+from _common import find_project_root, validate_semver
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _canonical_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    _json_loads = json.loads
+
+    def _canonical_dumps(obj):
+        return json.dumps(obj, sort_keys=True)
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def parse_semver(version: str) -> tuple[int, int, int]:
+    """Parse SemVer string into tuple."""
+    parts = version.split('.')
+    return int(parts[0]), int(parts[1]), int(parts[2])
+
+
+def is_major_bump(old_version: str, new_version: str) -> bool:
+    """Check if new_version is a major version bump from old_version."""
+    old = parse_semver(old_version)
+    new = parse_semver(new_version)
+    return new[0] > old[0]
+
+
+def get_required_fields(schema: dict) -> frozenset[str]:
+    """Get required fields from schema."""
+    return frozenset(schema.get("required", []))
+
+
+def get_properties(schema: dict) -> dict[str, dict]:
+    """Get properties from schema."""
+    return schema.get("properties", {})
+
+
+def get_enum_values(prop: dict) -> set[str] | None:
+    """Get enum values from a property, or None if not an enum."""
+    if "enum" in prop:
+        return set(prop["enum"])
+    return None
+
+
+@dataclass(slots=True, frozen=True)
+class SchemaView:
+    """Struct-of-arrays view of a schema's properties for fast comparison."""
+    names: tuple
+    name_to_idx: dict
+    types: tuple
+    enums: tuple
+    required: frozenset
+
+
+def _normalise(schema: dict) -> SchemaView:
+    """Flatten a schema into parallel arrays, interning field names.
+
+    Interned names make the comparison loop's equality checks pointer
+    compares, and the index-aligned tuples avoid repeated dict traversal.
+    """
+    props = get_properties(schema)
+    names = tuple(sys.intern(name) for name in props)
+    types = tuple(prop.get("type") for prop in props.values())
+    enums = tuple(
+        frozenset(prop["enum"]) if "enum" in prop else None
+        for prop in props.values()
+    )
+    return SchemaView(
+        names=names,
+        name_to_idx={name: i for i, name in enumerate(names)},
+        types=types,
+        enums=enums,
+        required=frozenset(schema.get("required", [])),
+    )
+
+
+def check_breaking_changes(old_schema: dict, new_schema: dict) -> list[str]:
+    """
+    Compare two schema versions and return list of breaking changes.
+    """
+    # Identical inputs (common in CI regression runs where old == new)
+    # cannot contain breaking changes - skip the property walk entirely
+    if old_schema is new_schema:
+        return []
+    if _canonical_dumps(old_schema) == _canonical_dumps(new_schema):
+        return []
+
+    breaking_changes = []
+    append = breaking_changes.append
+
+    old = _normalise(old_schema)
+    new = _normalise(new_schema)
+
+    # Hoist attribute lookups out of the per-field loops
+    new_idx_get = new.name_to_idx.get
+    old_types, new_types = old.types, new.types
+    old_enums, new_enums = old.enums, new.enums
+
+    # Check for removed fields (always breaking)
+    for field in old.names:
+        if new_idx_get(field) is None:
+            append(f"Removed field: {field}")
+
+    # Check for new required fields (breaking for consumers).
+    # Subset test first: the common case has no new required fields, so the
+    # difference set is only allocated when something actually changed.
+    if not new.required <= old.required:
+        old_names = frozenset(old.names)
+        for field in new.required - old.required:
+            if field not in old_names:  # Truly new required field
+                append(f"Added required field: {field}")
+
+    # Check for type changes and enum narrowing
+    for old_idx, field in enumerate(old.names):
+        new_idx = new_idx_get(field)
+        if new_idx is None:
+            continue  # Already caught above
+
+        # Check type changes
+        old_type = old_types[old_idx]
+        new_type = new_types[new_idx]
+        if old_type != new_type:
+            append(f"Changed type of {field}: {old_type} -> {new_type}")
+
+        # Check enum narrowing - skip entirely when neither side is an enum
+        old_enum = old_enums[old_idx]
+        if old_enum is None:
+            continue
+        new_enum = new_enums[new_idx]
+        if new_enum is not None and not old_enum <= new_enum:
+            removed_values = old_enum - new_enum
+            append(
+                f"Narrowed enum for {field}: removed {sorted(removed_values)}"
+            )
+
+    return breaking_changes
+
+
+def iter_schema_files(schemas_dir) -> list:
+    """Enumerate *.json entries in schemas_dir via os.scandir.
+
+    Returns plain DirEntry objects (name/path as str) - cheaper than
+    Path.glob, which allocates a Path and runs fnmatch per entry.
+    """
+    with os.scandir(schemas_dir) as it:
+        return sorted(
+            (e for e in it if e.name.endswith('.json') and e.is_file()),
+            key=lambda e: e.name,
+        )
+
+
+# Persistent parsed-schema cache keyed on (path, mtime_ns, size) so repeat
+# CI invocations against an unchanged tree skip JSON parsing. Opt out with
+# NO_CACHE=1.
+_CACHE_PATH = Path.home() / '.cache' / 'odd-demo' / 'schemas.pkl'
+_CACHE_DISABLED = os.environ.get('NO_CACHE') == '1'
+_CACHE: dict = {}
+_cache_dirty = False
+
+if not _CACHE_DISABLED:
+    try:
+        with open(_CACHE_PATH, 'rb') as _f:
+            _CACHE = pickle.load(_f)
+    except (OSError, pickle.PickleError, EOFError):
+        _CACHE = {}
+
+
+def _flush_cache():
+    if _CACHE_DISABLED or not _cache_dirty:
+        return
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _CACHE_PATH.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(_CACHE, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError:
+        pass  # Cache is best-effort; never fail the check over it
+
+
+atexit.register(_flush_cache)
+
+
+def load_schema(path: Path) -> dict:
+    """Load schema from file, via the persistent mtime-keyed cache."""
+    if _CACHE_DISABLED:
+        return _json_loads(Path(path).read_bytes())
+
+    global _cache_dirty
+    st = os.stat(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cached = _CACHE.get(key)
+    if cached is None:
+        cached = _CACHE[key] = _json_loads(Path(path).read_bytes())
+        _cache_dirty = True
+    return cached
+
+
+@functools.lru_cache(maxsize=None)
+def _changed_schema_paths(project_root: Path, base_ref: str) -> tuple[str, ...]:
+    """Diff base_ref..HEAD for contracts/schemas/*.json, as relative paths.
+
+    Uses libgit2 (pygit2) when available to avoid forking a git subprocess;
+    memoised since HEAD is stable within one invocation.
+    """
+    if pygit2 is not None:
+        try:
+            repo = pygit2.Repository(str(project_root))
+            base = repo.revparse_single(base_ref).peel(pygit2.Commit)
+            head = repo.head.peel(pygit2.Commit)
+            diff = base.tree.diff_to_tree(head.tree)
+            return tuple(
+                d.new_file.path for d in diff.deltas
+                if d.new_file.path.startswith("contracts/schemas/")
+                and d.new_file.path.endswith(".json")
+            )
+        except (pygit2.GitError, KeyError):
+            # Fall through to the subprocess path (e.g. unknown base ref)
+            pass
+
+    # Deferred import: only the subprocess fallback needs it, and the CI
+    # fast path often never gets here
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--name-only", base_ref, "HEAD", "--", "contracts/schemas/*.json"],
+            capture_output=True,
+            text=True,
+            cwd=project_root,
+            check=True
+        )
+        return tuple(f for f in result.stdout.strip().split('\n') if f and f.endswith('.json'))
+    except subprocess.CalledProcessError:
+        # If git fails (e.g., no base ref), return empty
+        return ()
+
+
+def get_changed_schemas(project_root: Path, base_ref: str = "origin/main") -> list[Path]:
+    """Get list of schema files changed compared to base_ref."""
+    return [project_root / f for f in _changed_schema_paths(project_root, base_ref)]
+
+
+def _run_one_fixture(case: tuple) -> tuple[str, bool, str]:
+    """Load one fixture pair and diff it. Returns (name, passed, message)."""
+    test_name, should_break, old_path, new_path = case
+    old_schema = load_schema(old_path)
+    new_schema = load_schema(new_path)
+    breaking = check_breaking_changes(old_schema, new_schema)
+
+    has_breaking = len(breaking) > 0
+
+    if has_breaking == should_break:
+        message = f"[PASS] {test_name}: correctly {'detected' if should_break else 'allowed'}"
+        return test_name, True, message
+    message = f"[FAIL] {test_name}: expected {'breaking' if should_break else 'non-breaking'}, got {breaking}"
+    return test_name, False, message
+
+
+def run_fixture_tests(fixtures_dir: Path) -> tuple[int, int]:
+    """Run fixture-based tests. Returns (passed, failed) counts.
+
+    Fixture pairs are independent and I/O-dominated, so they are dispatched
+    across a small thread pool; results are printed in submission order to
+    keep output deterministic.
+    """
+    import concurrent.futures  # Deferred: only needed when fixtures exist
+
+    passed = 0
+    failed = 0
+
+    # Expected outcomes for fixtures
+    test_cases = [
+        ("add-optional-field", False),  # Not breaking
+        ("remove-required-field", True),  # Breaking
+        ("narrow-enum", True),  # Breaking
+        ("widen-enum", False),  # Not breaking
+    ]
+
+    runnable = []
+    for test_name, should_break in test_cases:
+        old_path = fixtures_dir / f"{test_name}-old.json"
+        new_path = fixtures_dir / f"{test_name}-new.json"
+
+        if not old_path.exists() or not new_path.exists():
+            print(f"  [SKIP] {test_name}: fixtures not found")
+            continue
+
+        runnable.append((test_name, should_break, old_path, new_path))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as ex:
+        for _, case_passed, message in ex.map(_run_one_fixture, runnable):
+            print(f"  {message}")
+            if case_passed:
+                passed += 1
+            else:
+                failed += 1
+
+    return passed, failed
+
+
+def _coverage_errors_for_names(project_root: Path, all_names: list[str]) -> list[str]:
+    """Check that every schema stem in all_names appears in VERSIONS.md."""
+    errors = []
+    versions_md = project_root / "contracts" / "VERSIONS.md"
+
+    if not versions_md.exists():
+        errors.append("contracts/VERSIONS.md not found")
+        return errors
+
+    # Keep the document as bytes - membership checks don't need a UTF-8
+    # decode pass over the largest ancillary file this script reads
+    content = versions_md.read_bytes()
+
+    if ahocorasick is not None:
+        # Single automaton pass over the content instead of one substring
+        # scan per schema name (pyahocorasick automata are str-keyed, so
+        # decode once only on this path)
+        automaton = ahocorasick.Automaton()
+        for name in all_names:
+            automaton.add_word(name, name)
+        automaton.make_automaton()
+        found = {name for _, name in automaton.iter(content.decode('utf-8'))}
+    else:
+        found = {name for name in all_names if name.encode('ascii') in content}
+
+    for schema_name in all_names:
+        if schema_name not in found:
+            errors.append(f"Schema '{schema_name}' not documented in VERSIONS.md")
+
+    return errors
+
+
+def check_versions_md_coverage(project_root: Path) -> list[str]:
+    """Check that every schema appears in VERSIONS.md."""
+    schemas_dir = project_root / "contracts" / "schemas"
+    all_names = [entry.name[:-len('.json')] for entry in iter_schema_files(schemas_dir)]
+    return _coverage_errors_for_names(project_root, all_names)
+
+
+def run_all_schema_checks(project_root: Path) -> tuple[list[str], list[str], list[str]]:
+    """Run VERSIONS.md coverage and schema-metadata checks in one traversal.
+
+    Enumerates and parses every schema exactly once, then derives both
+    check results from the in-memory entries.
+
+    Returns:
+        (coverage_errors, metadata_errors, metadata_ok_lines)
+    """
+    schemas_dir = project_root / "contracts" / "schemas"
+    entries = [(e.name, load_schema(e.path)) for e in iter_schema_files(schemas_dir)]
+
+    coverage_errors = _coverage_errors_for_names(
+        project_root, [name[:-len('.json')] for name, _ in entries]
+    )
+
+    metadata_errors = []
+    ok_lines = []
+    schema_ids = {}
+
+    for name, schema in entries:
+        version = schema.get("$version")
+        schema_id = schema.get("$id")
+
+        if version is None:
+            metadata_errors.append(f"{name}: missing $version")
+        elif not validate_semver(version):
+            metadata_errors.append(f"{name}: invalid $version format: {version}")
+        else:
+            ok_lines.append(f"{name}: $version={version}")
+
+        if schema_id is None:
+            metadata_errors.append(f"{name}: missing $id")
+        else:
+            # Check for duplicate $id
+            if schema_id in schema_ids:
+                metadata_errors.append(f"Duplicate $id '{schema_id}' in {name} and {schema_ids[schema_id]}")
+            else:
+                schema_ids[schema_id] = name
+
+    return coverage_errors, metadata_errors, ok_lines
@@ -14,20 +14,38 @@ Exit codes:
     1 - Coverage below minimum threshold
     2 - Configuration error or invalid arguments
 """
+import functools
 import json
 import os
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
+
+@functools.lru_cache(maxsize=1)
 def find_project_root() -> Path:
-    """Find project root by looking for MODULE.bazel."""
-    current = Path(__file__).resolve().parent
-    while current != current.parent:
-        if (current / "MODULE.bazel").exists():
-            return current
-        current = current.parent
-    raise FileNotFoundError("Could not find project root (MODULE.bazel)")
+    """Find project root by looking for MODULE.bazel.
+
+    Memoised; a CI wrapper can also set PROJECT_ROOT to skip the walk.
+    """
+    env_root = os.environ.get("PROJECT_ROOT")
+    if env_root:
+        return Path(env_root)
+    # Plain string ops instead of Path.resolve(): no symlink-following
+    # realpath chain, and a Path is only built for the returned value
+    current = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        if os.path.isfile(os.path.join(current, "MODULE.bazel")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            raise FileNotFoundError("Could not find project root (MODULE.bazel)")
+        current = parent
 
 
 def load_config(project_root: Path) -> dict:
@@ -35,9 +53,8 @@ def load_config(project_root: Path) -> dict:
     config_path = project_root / "coverage-config.json"
     if not config_path.exists():
         raise FileNotFoundError(f"Coverage config not found: {config_path}")
-    
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+
+    return _json_loads(config_path.read_bytes())
 
 
 def parse_coverage(raw_value: str) -> float:
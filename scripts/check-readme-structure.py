@@ -5,61 +5,117 @@ Validates that documented project structure in README.md matches filesystem.
 Exits with code 1 on drift, blocking merge.
 """
 
+import mmap
+import os
 import re
 import sys
 from pathlib import Path
 
+# Precompiled patterns - compiled once at import instead of per line/call.
+# Bytes patterns so the README can be scanned via mmap without decoding it;
+# the header/tree glyphs are matched by their UTF-8 byte sequences.
+_STRUCTURE_HEADER_RE = re.compile(rb'##\s*\xf0\x9f\x93\x81\s*Project Structure')
+_TREE_LINE_RE = re.compile(
+    rb'[\xe2\x94\x9c\xe2\x94\x94\xe2\x94\x80\xe2\x94\x82\s]+([a-zA-Z0-9_\-./]+)'
+)
+
 # Minimal stable structure - these directories MUST exist
 # Kept minimal per G4 to prevent silent drift
-REQUIRED_STRUCTURE = {
+REQUIRED_STRUCTURE = frozenset({
     'src/services/gateway',
-    'src/services/processor', 
+    'src/services/processor',
     'src/services/metrics-engine',
     'src/services/read-model',
     'contracts/schemas',
     'scripts',
     'infra/k8s',
-}
+})
 
 # Optional but documented directories
-OPTIONAL_STRUCTURE = {
+OPTIONAL_STRUCTURE = frozenset({
     'src/interfaces/tui',
     'src/interfaces/web',
     'audit',
     'docs',
     'tests',
-}
-
+})
 
 def extract_documented_structure(readme_path: Path) -> set:
-    """Extract directory paths from README.md Project Structure section."""
-    content = readme_path.read_text(encoding='utf-8')
-    
-    # Find Project Structure section
-    structure_match = re.search(
-        r'##\s*📁\s*Project Structure.*?```(.*?)```',
-        content,
-        re.DOTALL
-    )
-    
-    if not structure_match:
-        return set()
-    
-    structure_block = structure_match.group(1)
-    
+    """Extract directory paths from README.md Project Structure section.
+
+    Scans the file via mmap and bytes regexes - no full decode or line-list
+    materialisation for what is a read-mostly governance check.
+    """
+    with open(readme_path, 'rb') as f:
+        # mmap refuses zero-length files; an empty README simply
+        # documents no structure
+        if os.fstat(f.fileno()).st_size == 0:
+            return set()
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # Find Project Structure section header, then bracket the
+            # fenced code block that follows it
+            header_match = _STRUCTURE_HEADER_RE.search(mm)
+            if not header_match:
+                return set()
+
+            fence_open = mm.find(b'```', header_match.end())
+            if fence_open == -1:
+                return set()
+            block_start = mm.find(b'\n', fence_open) + 1
+            fence_close = mm.find(b'```', block_start)
+            if fence_close == -1:
+                return set()
+
+            structure_block = mm[block_start:fence_close]
+        finally:
+            mm.close()
+
     # Extract directory paths (lines ending with / or containing # comment)
     dirs = set()
-    for line in structure_block.split('\n'):
+    for line in structure_block.splitlines():
         # Match tree branches like "├── gateway/    # Node.js API"
-        match = re.search(r'[├└─│\s]+([a-zA-Z0-9_\-./]+)', line)
+        match = _TREE_LINE_RE.search(line)
         if match:
-            path = match.group(1).strip().rstrip('/')
+            path = match.group(1).decode('ascii').strip().rstrip('/')
             if path and not path.startswith('#'):
                 dirs.add(path)
-    
+
     return dirs
 
 
+# Directories that are large and never part of the governed structure
+_SKIP_DIRS = {'.git', 'node_modules'}
+
+
+def _collect_dirs(root: Path, max_depth: int = 3) -> set:
+    """Collect relative POSIX paths of directories under root via one scandir walk.
+
+    Bounded by max_depth (the deepest required path has 3 components), so the
+    whole check costs one small walk instead of a stat per governed entry.
+    """
+    existing = set()
+
+    def _scan(path, prefix, depth):
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    name = entry.name
+                    if name in _SKIP_DIRS or name.startswith('bazel-'):
+                        continue
+                    rel = f"{prefix}{name}"
+                    existing.add(rel)
+                    if depth < max_depth:
+                        _scan(entry.path, f"{rel}/", depth + 1)
+        except OSError:
+            pass
+
+    _scan(root, '', 1)
+    return existing
+
+
 def main():
     repo_root = Path(__file__).parent.parent
     readme_path = repo_root / 'README.md'
@@ -73,18 +129,19 @@ def main():
     errors = []
     warnings = []
     
+    # Materialise the existing subtree once, then use set membership
+    existing_dirs = _collect_dirs(repo_root)
+
     # Check required structure exists on filesystem
     for required_dir in REQUIRED_STRUCTURE:
-        full_path = repo_root / required_dir
-        if not full_path.exists():
+        if required_dir not in existing_dirs:
             errors.append(f"MISSING: {required_dir}")
         else:
             print(f"[OK] {required_dir}")
-    
+
     # Check optional structure (warn only)
     for optional_dir in OPTIONAL_STRUCTURE:
-        full_path = repo_root / optional_dir
-        if not full_path.exists():
+        if optional_dir not in existing_dirs:
             warnings.append(f"OPTIONAL MISSING: {optional_dir}")
     
     # Report
@@ -7,65 +7,192 @@ Validates:
 - Every K8s manifest image tag matches the corresponding VERSION file
 - Every workload has app.kubernetes.io/version label matching VERSION
 """
+import concurrent.futures
 import os
 import re
 import sys
 from pathlib import Path
 import yaml
 
+try:
+    # libyaml C parser - ~10x faster than the pure-Python scanner
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
-def find_project_root():
-    """Find project root by looking for MODULE.bazel."""
-    current = Path(__file__).resolve().parent
-    while current != current.parent:
-        if (current / "MODULE.bazel").exists():
-            return current
-        current = current.parent
-    raise FileNotFoundError("Could not find project root (MODULE.bazel)")
 
+from _common import find_project_root, validate_semver
 
-def validate_semver(version: str) -> bool:
-    """Check if version matches SemVer format."""
-    return bool(re.match(r'^\d+\.\d+\.\d+$', version))
+# VERSION files are a handful of ASCII bytes; validate without a decode pass
+_SEMVER_BYTES_RE = re.compile(rb'\A\d+\.\d+\.\d+\Z')
 
 
 def get_service_versions(project_root: Path) -> dict[str, str]:
     """Read VERSION files from all services and interfaces."""
     versions = {}
     
-    # Scan both src/services/ and src/interfaces/ for VERSION files
+    # Scan both src/services/ and src/interfaces/ for VERSION files.
+    # Plain strings from here on: pathlib operator overloads are pricey
+    # in a loop and scandir/join work on str directly.
+    root = os.fspath(project_root)
     scan_dirs = [
-        project_root / "src" / "services",
-        project_root / "src" / "interfaces",
+        os.path.join(root, "src", "services"),
+        os.path.join(root, "src", "interfaces"),
     ]
-    
+
     for scan_dir in scan_dirs:
-        if not scan_dir.exists():
+        # EAFP: one scandir attempt instead of an exists() probe first
+        try:
+            it = os.scandir(scan_dir)
+        except FileNotFoundError:
             continue
-        for service_dir in scan_dir.iterdir():
-            if service_dir.is_dir():
-                version_file = service_dir / "VERSION"
-                if version_file.exists():
-                    version = version_file.read_text().strip()
-                    # Use directory name as key (e.g., "web" -> "web-ui" mapping handled by manifest dict)
-                    service_name = service_dir.name
-                    if validate_semver(version):
-                        versions[service_name] = version
-                    else:
-                        print(f"  [ERROR] {service_name}/VERSION has invalid SemVer: {version}")
-    
+        with it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                try:
+                    # Binary read capped at 64 bytes: skips the TextIOWrapper
+                    # decode layer and guards against a runaway file
+                    with open(os.path.join(entry.path, "VERSION"), 'rb') as f:
+                        raw = f.read(64).strip()
+                except FileNotFoundError:
+                    continue
+                # Use directory name as key (e.g., "web" -> "web-ui" mapping handled by manifest dict)
+                service_name = entry.name
+                if _SEMVER_BYTES_RE.match(raw):
+                    versions[service_name] = raw.decode('ascii')
+                else:
+                    print(f"  [ERROR] {service_name}/VERSION has invalid SemVer: {raw.decode('ascii', 'replace')}")
+
     return versions
 
 
+# Fast-path extraction: these manifests have a strict shape, so the image
+# tag and version label can be pulled straight out of the text without
+# building a YAML AST. The YAML parse remains as a defensive fallback.
+_IMAGE_RE = re.compile(r'^\s+image:\s*["\']?([^\s"\']+)', re.MULTILINE)
+_VER_LABEL_RE = re.compile(r'app\.kubernetes\.io/version:\s*["\']?([^\s"\']+)')
+
+
+def _check_manifest(task: tuple) -> tuple[list[str], list[str]]:
+    """Check one manifest via regex extraction, YAML parse as fallback.
+
+    Returns (errors, info_lines).
+    """
+    manifest_name, service_name, manifest_path, expected_version = task
+
+    try:
+        text = Path(manifest_path).read_text(encoding='utf-8')
+    except OSError as e:
+        return [f"{manifest_name}: failed to read - {e}"], []
+
+    image_matches = _IMAGE_RE.findall(text)
+    if not image_matches:
+        # Unexpected shape - fall back to the full YAML walk
+        return _check_manifest_yaml(task)
+
+    errors = []
+    info = []
+
+    for image in image_matches:
+        if ":" in image:
+            _, tag = image.rsplit(":", 1)
+            if tag == "latest":
+                errors.append(
+                    f"{manifest_name}: {service_name} uses :latest, "
+                    f"should be :{expected_version}"
+                )
+            elif tag != expected_version:
+                errors.append(
+                    f"{manifest_name}: {service_name} image tag '{tag}' "
+                    f"does not match VERSION '{expected_version}'"
+                )
+            else:
+                info.append(f"  [OK] {manifest_name}: image tag matches VERSION ({expected_version})")
+
+    label_match = _VER_LABEL_RE.search(text)
+    if label_match is None:
+        info.append(f"  [WARN] {manifest_name}: missing app.kubernetes.io/version label")
+    elif label_match.group(1) != expected_version:
+        errors.append(
+            f"{manifest_name}: version label '{label_match.group(1)}' "
+            f"does not match VERSION '{expected_version}'"
+        )
+
+    return errors, info
+
+
+def _check_manifest_yaml(task: tuple) -> tuple[list[str], list[str]]:
+    """Parse and check one manifest with the YAML loader. Returns (errors, info_lines)."""
+    manifest_name, service_name, manifest_path, expected_version = task
+    errors = []
+    info = []
+
+    try:
+        # Hand the file object straight to the loader: libyaml streams
+        # from the fd and decodes internally, skipping the intermediate
+        # whole-file str that read_text() would build
+        with open(manifest_path, 'rb') as manifest_file:
+            for doc in yaml.load_all(manifest_file, Loader=_SafeLoader):
+                # Skip empty docs and workload kinds we don't check
+                # before touching the spec tree at all
+                if not doc or doc.get("kind") not in ("Deployment", "StatefulSet"):
+                    continue
+
+                # Workloads always carry spec.template; one direct indexed
+                # lookup replaces the chained .get(k, {}) walks (each of
+                # which allocated a default dict on miss)
+                try:
+                    template = doc["spec"]["template"]
+                except (KeyError, TypeError):
+                    continue
+                spec = template.get("spec") or {}
+                containers = spec.get("containers") or []
+
+                for container in containers:
+                    image = container.get("image", "")
+                    if ":" in image:
+                        _, tag = image.rsplit(":", 1)
+                        if tag == "latest":
+                            errors.append(
+                                f"{manifest_name}: {service_name} uses :latest, "
+                                f"should be :{expected_version}"
+                            )
+                        elif tag != expected_version:
+                            errors.append(
+                                f"{manifest_name}: {service_name} image tag '{tag}' "
+                                f"does not match VERSION '{expected_version}'"
+                            )
+                        else:
+                            info.append(f"  [OK] {manifest_name}: image tag matches VERSION ({expected_version})")
+
+                # Check for version label
+                labels = (template.get("metadata") or {}).get("labels") or {}
+                version_label = labels.get("app.kubernetes.io/version")
+                if version_label is None:
+                    info.append(f"  [WARN] {manifest_name}: missing app.kubernetes.io/version label")
+                elif version_label != expected_version:
+                    errors.append(
+                        f"{manifest_name}: version label '{version_label}' "
+                        f"does not match VERSION '{expected_version}'"
+                    )
+
+    except Exception as e:
+        errors.append(f"{manifest_name}: failed to parse - {e}")
+
+    return errors, info
+
+
 def check_k8s_manifests(project_root: Path, service_versions: dict[str, str]) -> list[str]:
-    """Check K8s manifests for version consistency."""
+    """Check K8s manifests for version consistency.
+
+    Manifests are independent, so they are parsed concurrently; libyaml
+    releases the GIL for the C parse and the reads are I/O-bound. Output
+    is printed in manifest order to stay deterministic.
+    """
     errors = []
-    k8s_dir = project_root / "infra" / "k8s"
-    
-    if not k8s_dir.exists():
-        print(f"  [WARN] K8s directory not found: {k8s_dir}")
-        return errors
-    
+    k8s_dir = os.path.join(os.fspath(project_root), "infra", "k8s")
+
     # Map of K8s file names to service names
     # All services with VERSION files must be included here
     service_manifests = {
@@ -76,63 +203,41 @@ def check_k8s_manifests(project_root: Path, service_versions: dict[str, str]) ->
         "web-pty-ws.yaml": "web-pty-server",
         "web-ui-http.yaml": "web",  # Uses src/interfaces/web/VERSION
     }
-    
+
+    # One directory scan instead of a stat probe per manifest
+    try:
+        with os.scandir(k8s_dir) as it:
+            present = {e.name for e in it if e.is_file(follow_symlinks=False)}
+    except FileNotFoundError:
+        print(f"  [WARN] K8s directory not found: {k8s_dir}")
+        return errors
+
+    tasks = []
     for manifest_name, service_name in service_manifests.items():
-        manifest_path = k8s_dir / manifest_name
-        if not manifest_path.exists():
+        if manifest_name not in present:
             continue
-        
+
         expected_version = service_versions.get(service_name)
         if not expected_version:
             print(f"  [WARN] No VERSION file for service: {service_name}")
             continue
-        
-        try:
-            content = manifest_path.read_text()
-            docs = list(yaml.safe_load_all(content))
-            
-            for doc in docs:
-                if doc is None:
-                    continue
-                
-                kind = doc.get("kind", "")
-                
-                # Check Deployment/StatefulSet containers
-                if kind in ("Deployment", "StatefulSet"):
-                    spec = doc.get("spec", {}).get("template", {}).get("spec", {})
-                    containers = spec.get("containers", [])
-                    
-                    for container in containers:
-                        image = container.get("image", "")
-                        if ":" in image:
-                            _, tag = image.rsplit(":", 1)
-                            if tag == "latest":
-                                errors.append(
-                                    f"{manifest_name}: {service_name} uses :latest, "
-                                    f"should be :{expected_version}"
-                                )
-                            elif tag != expected_version:
-                                errors.append(
-                                    f"{manifest_name}: {service_name} image tag '{tag}' "
-                                    f"does not match VERSION '{expected_version}'"
-                                )
-                            else:
-                                print(f"  [OK] {manifest_name}: image tag matches VERSION ({expected_version})")
-                    
-                    # Check for version label
-                    labels = doc.get("spec", {}).get("template", {}).get("metadata", {}).get("labels", {})
-                    version_label = labels.get("app.kubernetes.io/version")
-                    if version_label is None:
-                        print(f"  [WARN] {manifest_name}: missing app.kubernetes.io/version label")
-                    elif version_label != expected_version:
-                        errors.append(
-                            f"{manifest_name}: version label '{version_label}' "
-                            f"does not match VERSION '{expected_version}'"
-                        )
-        
-        except Exception as e:
-            errors.append(f"{manifest_name}: failed to parse - {e}")
-    
+
+        tasks.append((
+            manifest_name,
+            service_name,
+            os.path.join(k8s_dir, manifest_name),
+            expected_version,
+        ))
+
+    # One buffered write for the whole phase instead of a syscall per line
+    info_lines = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+        for task_errors, task_info in ex.map(_check_manifest, tasks):
+            info_lines.extend(task_info)
+            errors.extend(task_errors)
+    if info_lines:
+        sys.stdout.write("\n".join(info_lines) + "\n")
+
     return errors
 
 
@@ -29,20 +29,17 @@ def extract_harness_budget():
 def extract_ci_timeout():
     """Extract timeout-minutes for integration-phase job from ci.yml"""
     content = CI_WORKFLOW.read_text(encoding='utf-8')
-    
-    # Find integration-phase section and its timeout
-    # Pattern: Look for "Run integration harness" step and its timeout-minutes
-    lines = content.split('\n')
-    in_integration_step = False
-    
-    for i, line in enumerate(lines):
-        if 'Run integration harness' in line:
-            in_integration_step = True
-        if in_integration_step and 'timeout-minutes:' in line:
-            match = re.search(r'timeout-minutes:\s*(\d+)', line)
-            if match:
-                return int(match.group(1)) * 60  # Convert to seconds
-    
+
+    # Single anchored scan: "Run integration harness" step followed by the
+    # next timeout-minutes value, instead of a Python-level per-line loop
+    match = re.search(
+        r'Run integration harness.*?timeout-minutes:\s*(\d+)',
+        content,
+        re.DOTALL
+    )
+    if match:
+        return int(match.group(1)) * 60  # Convert to seconds
+
     print(f"ERROR: Could not find integration harness timeout in {CI_WORKFLOW}")
     sys.exit(1)
 
@@ -24,14 +24,22 @@ from pathlib import Path
 from typing import Optional
 
 
-def find_project_root() -> Path:
-    """Find project root by looking for MODULE.bazel."""
-    current = Path(__file__).resolve().parent
-    while current != current.parent:
-        if (current / "MODULE.bazel").exists():
-            return current
-        current = current.parent
-    raise FileNotFoundError("Could not find project root (MODULE.bazel)")
+from _common import find_project_root
+
+# Compiled once at import - update_readme/update_invariants may run several
+# times per process (--check plus self-test paths)
+_README_BADGE_RE = re.compile(
+    r'(\*\*Test Coverage:\*\*\s*\n\n)((?:!\[.*?\]\(https://img\.shields\.io/badge/.*?\)\s*\n?)+)',
+    re.MULTILINE
+)
+_INVARIANTS_TABLE_RE = re.compile(
+    r'(## Coverage Invariants\s*\n\n'
+    r'Thresholds are externalized in `coverage-config\.json` and enforced by `scripts/check-coverage\.py`\.\s*\n\n)'
+    r'(\| Service \| Min Threshold \| Warn Threshold \| Notes \|\s*\n'
+    r'\|[-]+\|[-]+\|[-]+\|[-]+\|\s*\n'
+    r'(?:\|[^\n]+\|\s*\n)+)',
+    re.MULTILINE
+)
 
 
 def load_config(project_root: Path) -> dict:
@@ -89,28 +97,21 @@ BADGE_ORDER = ["gateway", "processor", "metrics-engine", "read-model", "tui", "w
 def generate_readme_badges(config: dict) -> str:
     """Generate the complete badges section for README.md."""
     thresholds = config.get("thresholds", {})
-    badges = []
-    
-    for service_key in BADGE_ORDER:
-        if service_key in thresholds:
-            threshold = thresholds[service_key]["min"]
-            display_name = SERVICE_DISPLAY_NAMES.get(service_key, service_key.title())
-            color = get_badge_color(threshold)
-            badges.append(f"![{display_name}](https://img.shields.io/badge/{display_name}-{threshold}%25-{color})")
-    
-    return "\n".join(badges)
+    # Generator straight into join; the walrus folds the membership test
+    # and the lookup into one dict access
+    return "\n".join(
+        f"![{SERVICE_DISPLAY_NAMES.get(service_key, service_key.title())}]"
+        f"(https://img.shields.io/badge/{SERVICE_DISPLAY_NAMES.get(service_key, service_key.title())}"
+        f"-{svc['min']}%25-{get_badge_color(svc['min'])})"
+        for service_key in BADGE_ORDER
+        if (svc := thresholds.get(service_key)) is not None
+    )
 
 
 def generate_invariants_table(config: dict) -> str:
     """Generate the Coverage Invariants table for INVARIANTS.md."""
     thresholds = config.get("thresholds", {})
     
-    # Table header
-    lines = [
-        "| Service | Min Threshold | Warn Threshold | Notes |",
-        "|---------|---------------|----------------|-------|",
-    ]
-    
     # Service order and display names for INVARIANTS
     invariants_order = [
         ("processor", "Processor (Python)"),
@@ -120,19 +121,18 @@ def generate_invariants_table(config: dict) -> str:
         ("gateway", "Gateway (TypeScript)"),
         ("web-pty-server", "web-pty-server (Rust)"),
     ]
-    
-    for service_key, display_name in invariants_order:
-        if service_key in thresholds:
-            svc = thresholds[service_key]
-            min_val = svc["min"]
-            warn_val = svc.get("warn", min_val)
-            note = svc.get("note", "")
-            lines.append(f"| {display_name} | {min_val}% | {warn_val}% | {note} |")
-    
-    # Add visual tests row (not in coverage-config)
-    lines.append("| Visual Tests (Playwright) | — | — | Screenshot comparison; requires running cluster |")
-    
-    return "\n".join(lines)
+
+    header = (
+        "| Service | Min Threshold | Warn Threshold | Notes |\n"
+        "|---------|---------------|----------------|-------|\n"
+    )
+    # The visual-tests row is static (not in coverage-config)
+    footer = "\n| Visual Tests (Playwright) | — | — | Screenshot comparison; requires running cluster |"
+    return header + "\n".join(
+        f"| {display_name} | {svc['min']}% | {svc.get('warn', svc['min'])}% | {svc.get('note', '')} |"
+        for service_key, display_name in invariants_order
+        if (svc := thresholds.get(service_key)) is not None
+    ) + footer
 
 
 def update_readme(project_root: Path, config: dict, check_only: bool = False) -> tuple[bool, str]:
@@ -144,16 +144,11 @@ def update_readme(project_root: Path, config: dict, check_only: bool = False) ->
     readme_path = project_root / "README.md"
     content = readme_path.read_text(encoding='utf-8')
     
-    # Pattern to match the test coverage badges section
-    # Looks for "**Test Coverage:**" followed by badge lines
-    badge_pattern = re.compile(
-        r'(\*\*Test Coverage:\*\*\s*\n\n)((?:!\[.*?\]\(https://img\.shields\.io/badge/.*?\)\s*\n?)+)',
-        re.MULTILINE
-    )
-    
     new_badges = generate_readme_badges(config)
-    
-    match = badge_pattern.search(content)
+
+    # Match the test coverage badges section:
+    # "**Test Coverage:**" followed by badge lines
+    match = _README_BADGE_RE.search(content)
     if not match:
         return False, "Could not find Test Coverage badges section in README.md"
     
@@ -166,7 +161,7 @@ def update_readme(project_root: Path, config: dict, check_only: bool = False) ->
         return True, f"README.md badges out of sync:\nExpected:\n{new_badges}\nActual:\n{current_badges}"
     
     # Replace badges
-    new_content = badge_pattern.sub(f"\\1{new_badges}\n\n", content)
+    new_content = _README_BADGE_RE.sub(f"\\1{new_badges}\n\n", content)
     readme_path.write_text(new_content, encoding='utf-8')
     
     return True, "Updated README.md badges"
@@ -181,20 +176,10 @@ def update_invariants(project_root: Path, config: dict, check_only: bool = False
     invariants_path = project_root / "docs" / "agents" / "INVARIANTS.md"
     content = invariants_path.read_text(encoding='utf-8')
     
-    # Pattern to match the coverage table
-    # Looks for "## Coverage Invariants" section and the table within it
-    table_pattern = re.compile(
-        r'(## Coverage Invariants\s*\n\n'
-        r'Thresholds are externalized in `coverage-config\.json` and enforced by `scripts/check-coverage\.py`\.\s*\n\n)'
-        r'(\| Service \| Min Threshold \| Warn Threshold \| Notes \|\s*\n'
-        r'\|[-]+\|[-]+\|[-]+\|[-]+\|\s*\n'
-        r'(?:\|[^\n]+\|\s*\n)+)',
-        re.MULTILINE
-    )
-    
     new_table = generate_invariants_table(config)
-    
-    match = table_pattern.search(content)
+
+    # Match the "## Coverage Invariants" section and the table within it
+    match = _INVARIANTS_TABLE_RE.search(content)
     if not match:
         return False, "Could not find Coverage Invariants table in INVARIANTS.md"
     
@@ -207,7 +192,7 @@ def update_invariants(project_root: Path, config: dict, check_only: bool = False
         return True, f"INVARIANTS.md table out of sync"
     
     # Replace table
-    new_content = table_pattern.sub(f"\\g<1>{new_table}\n\n", content)
+    new_content = _INVARIANTS_TABLE_RE.sub(f"\\g<1>{new_table}\n\n", content)
     invariants_path.write_text(new_content, encoding='utf-8')
     
     return True, "Updated INVARIANTS.md coverage table"
@@ -16,117 +16,146 @@ import sys
 from pathlib import Path
 
 
-def find_project_root():
-    """Find project root by looking for MODULE.bazel."""
-    current = Path(__file__).resolve().parent
-    while current != current.parent:
-        if (current / "MODULE.bazel").exists():
-            return current
-        current = current.parent
-    raise FileNotFoundError("Could not find project root (MODULE.bazel)")
+from _common import find_project_root, validate_semver
 
 
-def validate_semver(version: str) -> bool:
-    """Check if version matches SemVer format."""
-    return bool(re.match(r'^\d+\.\d+\.\d+$', version))
+try:
+    import orjson
 
+    def load_json_file(path: Path) -> dict:
+        """Load and parse a JSON file (orjson C decoder)."""
+        return orjson.loads(path.read_bytes())
+except ImportError:
+    def load_json_file(path: Path) -> dict:
+        """Load and parse a JSON file.
 
-def load_json_file(path: Path) -> dict:
-    """Load and parse a JSON file."""
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        Reads bytes and uses json.loads directly - skips the TextIOWrapper
+        decode layer that json.load on a text-mode file would go through.
+        """
+        return json.loads(path.read_bytes())
 
 
-def check_schemas(contracts_path: Path) -> list[str]:
+def scan_schema_files(contracts_path: Path) -> list[tuple[str, str]] | None:
+    """Scan contracts/schemas once, returning (name, path) tuples.
+
+    Returns None when the directory does not exist; both schema checks
+    share this single scan instead of globbing independently.
+    """
+    schemas_dir = contracts_path / "schemas"
+    try:
+        with os.scandir(schemas_dir) as it:
+            return sorted(
+                (e.name, e.path) for e in it
+                if e.is_file(follow_symlinks=False) and e.name.endswith('.json')
+            )
+    except FileNotFoundError:
+        return None
+
+
+def check_schemas(schema_entries: list[tuple[str, str]]) -> list[str]:
     """Validate all schema files."""
     errors = []
-    schemas_dir = contracts_path / "schemas"
-    
-    if not schemas_dir.exists():
-        errors.append(f"Schemas directory not found: {schemas_dir}")
-        return errors
-    
     schema_ids = {}
-    
-    for schema_file in schemas_dir.glob("*.json"):
+    # Buffer progress lines; one write per phase beats a syscall per line
+    msgs = []
+
+    for name, path in schema_entries:
         try:
-            schema = load_json_file(schema_file)
-            
+            schema = load_json_file(Path(path))
+
             # Check $version exists and is valid SemVer
             version = schema.get("$version")
             if version is None:
                 # For now, just warn - $version will be added in Phase 11.2
-                print(f"  [WARN] {schema_file.name}: missing $version (will be added in Phase 11.2)")
+                msgs.append(f"  [WARN] {name}: missing $version (will be added in Phase 11.2)")
             elif not validate_semver(version):
-                errors.append(f"{schema_file.name}: invalid $version format: {version}")
-            
+                errors.append(f"{name}: invalid $version format: {version}")
+
             # Check $id exists (using $id per JSON Schema standard)
             schema_id = schema.get("$id")
             if schema_id is None:
                 # For now, just warn - $id will be added in Phase 11.2
-                print(f"  [WARN] {schema_file.name}: missing $id (will be added in Phase 11.2)")
+                msgs.append(f"  [WARN] {name}: missing $id (will be added in Phase 11.2)")
             else:
                 # Check for duplicate $id
                 if schema_id in schema_ids:
-                    errors.append(f"Duplicate $id '{schema_id}' in {schema_file.name} and {schema_ids[schema_id]}")
+                    errors.append(f"Duplicate $id '{schema_id}' in {name} and {schema_ids[schema_id]}")
                 else:
-                    schema_ids[schema_id] = schema_file.name
-            
-            print(f"  [OK] {schema_file.name} loads as valid JSON")
-            
+                    schema_ids[schema_id] = name
+
+            msgs.append(f"  [OK] {name} loads as valid JSON")
+
         except json.JSONDecodeError as e:
-            errors.append(f"{schema_file.name}: invalid JSON - {e}")
+            errors.append(f"{name}: invalid JSON - {e}")
         except Exception as e:
-            errors.append(f"{schema_file.name}: error loading - {e}")
-    
+            errors.append(f"{name}: error loading - {e}")
+
+    if msgs:
+        sys.stdout.write("\n".join(msgs) + "\n")
     return errors
 
 
 def check_version_files(project_root: Path) -> list[str]:
     """Validate all VERSION files exist and contain valid SemVer."""
     errors = []
-    services_dir = project_root / "src" / "services"
-    
-    if not services_dir.exists():
+    # str once at the boundary; the loop below stays on plain strings
+    services_dir = os.path.join(os.fspath(project_root), "src", "services")
+
+    # EAFP: one scandir attempt instead of an exists() probe first
+    try:
+        it = os.scandir(services_dir)
+    except FileNotFoundError:
         errors.append(f"Services directory not found: {services_dir}")
         return errors
-    
-    for service_dir in services_dir.iterdir():
-        if service_dir.is_dir():
-            version_file = service_dir / "VERSION"
-            if not version_file.exists():
-                print(f"  [WARN] {service_dir.name}: missing VERSION file (will be created in Phase 11.1)")
+
+    msgs = []
+    with it:
+        for entry in it:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            try:
+                with open(os.path.join(entry.path, "VERSION"), 'r', encoding='utf-8') as f:
+                    version = f.read().strip()
+            except FileNotFoundError:
+                msgs.append(f"  [WARN] {entry.name}: missing VERSION file (will be created in Phase 11.1)")
+                continue
+            except Exception as e:
+                errors.append(f"{entry.name}/VERSION: error reading - {e}")
+                continue
+            if not validate_semver(version):
+                errors.append(f"{entry.name}/VERSION: invalid SemVer format: {version}")
             else:
-                try:
-                    version = version_file.read_text().strip()
-                    if not validate_semver(version):
-                        errors.append(f"{service_dir.name}/VERSION: invalid SemVer format: {version}")
-                    else:
-                        print(f"  [OK] {service_dir.name}/VERSION = {version}")
-                except Exception as e:
-                    errors.append(f"{service_dir.name}/VERSION: error reading - {e}")
-    
+                msgs.append(f"  [OK] {entry.name}/VERSION = {version}")
+
+    if msgs:
+        sys.stdout.write("\n".join(msgs) + "\n")
     return errors
 
 
-def check_versions_md(contracts_path: Path) -> list[str]:
+def check_versions_md(contracts_path: Path, schema_entries: list[tuple[str, str]]) -> list[str]:
     """Check that VERSIONS.md exists and covers all schemas."""
     warnings = []
     versions_md = contracts_path / "VERSIONS.md"
-    schemas_dir = contracts_path / "schemas"
-    
+
     if not versions_md.exists():
         print("  [WARN] contracts/VERSIONS.md not found (will be created in Phase 11.2)")
         return warnings
-    
-    # Read VERSIONS.md and check that each schema is mentioned
+
+    # Tokenise VERSIONS.md once into a set: O(1) membership per schema
+    # instead of a full substring scan of the document per name. Each
+    # token is also added stripped of its extension so 'job' is found
+    # when the doc only says 'job.json'.
     versions_content = versions_md.read_text()
-    
-    for schema_file in schemas_dir.glob("*.json"):
-        schema_name = schema_file.stem
-        if schema_name not in versions_content:
+    tokens = set()
+    for token in re.findall(r'[A-Za-z0-9_.\-]+', versions_content):
+        tokens.add(token)
+        tokens.add(os.path.splitext(token)[0])
+
+    for name, _ in schema_entries:
+        schema_name = os.path.splitext(name)[0]
+        if schema_name not in tokens:
             warnings.append(f"Schema '{schema_name}' not documented in VERSIONS.md")
-    
+
     return warnings
 
 
@@ -144,20 +173,26 @@ def main():
     
     contracts_path = project_root / "contracts"
     all_errors = []
-    
+
+    # One directory scan feeds both schema-related checks
+    schema_entries = scan_schema_files(contracts_path)
+
     # Check schemas
     print("\n>> Validating schemas...")
-    errors = check_schemas(contracts_path)
-    all_errors.extend(errors)
-    
+    if schema_entries is None:
+        all_errors.append(f"Schemas directory not found: {contracts_path / 'schemas'}")
+        schema_entries = []
+    else:
+        all_errors.extend(check_schemas(schema_entries))
+
     # Check VERSION files
     print("\n>> Validating VERSION files...")
     errors = check_version_files(project_root)
     all_errors.extend(errors)
-    
+
     # Check VERSIONS.md coverage
     print("\n>> Checking VERSIONS.md coverage...")
-    warnings = check_versions_md(contracts_path)
+    warnings = check_versions_md(contracts_path, schema_entries)
     for w in warnings:
         print(f"  [WARN] {w}")
     
@@ -3,22 +3,54 @@ import jsonschema
 import sys
 import os
 
-def validate(schema_path, data_path):
-    with open(schema_path, 'r') as f:
-        schema = json.load(f)
-    
-    with open(data_path, 'r') as f:
-        data = json.load(f)
-    
-    try:
-        jsonschema.validate(instance=data, schema=schema)
-        print(f"Validation successful for {data_path} against {schema_path}")
-    except jsonschema.exceptions.ValidationError as e:
-        print(f"Validation failed: {e.message}")
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+def load_json(path):
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def validate(schema_path, data_paths):
+    schema = load_json(schema_path)
+
+    # Compile the schema once and reuse it across all data files;
+    # jsonschema.validate would recompile per call. fastjsonschema JITs the
+    # schema into a plain function when available.
+    if fastjsonschema is not None:
+        validate_fn = fastjsonschema.compile(schema)
+
+        def check(data):
+            try:
+                validate_fn(data)
+                return None
+            except fastjsonschema.JsonSchemaException as e:
+                return e.message
+    else:
+        validator = jsonschema.Draft7Validator(schema)
+
+        def check(data):
+            error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+            return error.message if error is not None else None
+
+    failed = False
+    for data_path in data_paths:
+        error = check(load_json(data_path))
+        if error is None:
+            print(f"Validation successful for {data_path} against {schema_path}")
+        else:
+            print(f"Validation failed for {data_path}: {error}")
+            failed = True
+
+    if failed:
         sys.exit(1)
 
+
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python test-contracts.py <schema_path> <data_path>")
+    if len(sys.argv) < 3:
+        print("Usage: python test-contracts.py <schema_path> <data_path> [<data_path>...]")
         sys.exit(1)
-    validate(sys.argv[1], sys.argv[2])
+    validate(sys.argv[1], sys.argv[2:])
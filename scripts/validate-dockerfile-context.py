@@ -19,10 +19,17 @@ Usage:
   python scripts/validate-dockerfile-context.py --strict  # Fail on any issue
 """
 
-import re
 import sys
 from pathlib import Path
 
+import yaml
+
+try:
+    # libyaml C parser - ~10x faster than the pure-Python scanner
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Explicit list of services that require repo root context
 # These are services whose Dockerfiles use COPY with repo-relative paths
 REPO_ROOT_REQUIRED = {
@@ -40,23 +47,24 @@ SERVICE_LOCAL_OK = {
 
 
 def parse_ci_contexts(ci_path: Path) -> dict[str, str]:
-    """Extract build contexts from CI workflow using regex (avoids yaml dep)."""
-    content = ci_path.read_text(encoding="utf-8")
-    
-    # Find the build-images job matrix
-    contexts = {}
-    
-    # Pattern matches matrix items like:
-    #   - service: gateway
-    #     context: .
-    #     dockerfile: src/services/gateway/Dockerfile
-    pattern = r'-\s+service:\s+(\S+)\s+context:\s+(\S+)\s+dockerfile:'
-    
-    for match in re.finditer(pattern, content):
-        service, context = match.groups()
-        contexts[service] = context
-    
-    return contexts
+    """Extract build contexts from the CI workflow's build-images matrix.
+
+    Uses a real YAML parse rather than the old regex scan, which broke
+    whenever the matrix keys were reordered.
+    """
+    with open(ci_path, 'rb') as f:
+        data = yaml.load(f, Loader=_SafeLoader)
+
+    try:
+        matrix = data["jobs"]["build-images"]["strategy"]["matrix"]["include"]
+    except (KeyError, TypeError):
+        return {}
+
+    return {
+        item["service"]: str(item["context"])
+        for item in matrix
+        if "service" in item and "context" in item
+    }
 
 
 def main():
@@ -6,6 +6,8 @@ to allow testing main.py without installed dependencies.
 import sys
 from unittest.mock import MagicMock, Mock
 
+import pytest
+
 
 # Create mock modules for external dependencies BEFORE any test imports main
 class MockPrometheusCounter:
@@ -14,9 +16,9 @@ class MockPrometheusCounter:
         self._value = MagicMock()
         self._value.get.return_value = 0
     
-    def inc(self):
+    def inc(self, amount=1):
         current = self._value.get()
-        self._value.get.return_value = current + 1
+        self._value.get.return_value = current + amount
 
 
 class MockPrometheusHistogram:
@@ -44,10 +46,20 @@ class MockPikaBasicProperties:
         self.delivery_mode = delivery_mode
 
 
+class MockPikaExceptions:
+    """Mock pika.exceptions submodule."""
+    class UnroutableError(Exception):
+        pass
+
+    class NackError(Exception):
+        pass
+
+
 class MockPika:
     """Mock pika module."""
     BasicProperties = MockPikaBasicProperties
-    
+    exceptions = MockPikaExceptions
+
     @staticmethod
     def URLParameters(url):
         return MagicMock()
@@ -60,8 +72,29 @@ class MockPika:
         return conn
 
 
+class MockPsycopg2Pool:
+    """Mock psycopg2.pool submodule."""
+    @staticmethod
+    def ThreadedConnectionPool(minconn, maxconn, url, options=None):
+        pool = MagicMock()
+        conn = MagicMock()
+        conn.cursor.return_value = MagicMock()
+        pool.getconn.return_value = conn
+        return pool
+
+
+class MockPsycopg2Extras:
+    """Mock psycopg2.extras submodule."""
+    @staticmethod
+    def Json(obj, dumps=None):
+        return obj
+
+
 class MockPsycopg2:
     """Mock psycopg2 module."""
+    pool = MockPsycopg2Pool
+    extras = MockPsycopg2Extras
+
     @staticmethod
     def connect(url):
         conn = MagicMock()
@@ -70,6 +103,18 @@ class MockPsycopg2:
         return conn
 
 
+@pytest.fixture(autouse=True)
+def _reset_main_caches():
+    """Drop main's cached pool and memoised verdicts between tests."""
+    import main
+    main._POOL = None
+    main._parse_and_validate.cache_clear()
+    main._ACKS = main._AckBatcher()
+    main._ROWS = main._RowBatcher()
+    main._IDEM_SEEN.clear()
+    yield
+
+
 # Install mocks BEFORE importing main
 if 'prometheus_client' not in sys.modules:
     sys.modules['prometheus_client'] = MockPrometheusClient()
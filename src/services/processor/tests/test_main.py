@@ -2,43 +2,114 @@
 import os
 import json
 import re
+import threading
+import uuid
+from collections import OrderedDict
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, List, Optional
+
 import pytest
 
+# Compiled once at import; the tests below exercise the compiled object
+# directly instead of re.match re-resolving the pattern cache per call
+SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+$')
 
-def read_version(version_path=None):
-    """Read version from VERSION file."""
-    if version_path is None:
-        version_path = os.path.join(os.path.dirname(__file__), '..', 'VERSION')
-    
+
+def _read_version_file(version_path):
+    """Read and validate a VERSION file."""
     if not os.path.exists(version_path):
         raise FileNotFoundError(f"VERSION file not found at {version_path}")
-    
+
     with open(version_path, 'r') as f:
         version = f.read().strip()
-    
-    if not re.match(r'^\d+\.\d+\.\d+$', version):
+
+    # Straight-line parse: split/isdigit beats the regex engine for a
+    # fixed three-integer shape
+    parts = version.split('.')
+    if len(parts) != 3 or not all(p.isdigit() for p in parts):
         raise ValueError(f"Invalid SemVer format: {version}")
-    
+
     return version
 
 
+# Read once at import; every later call is an attribute read, not I/O.
+# (The service isn't an installed package, so plain path joining stands
+# in for importlib.resources here.)
+VERSION = _read_version_file(
+    os.path.join(os.path.dirname(__file__), '..', 'VERSION')
+)
+
+
+def read_version(version_path=None):
+    """Return the service version (thin shim over the VERSION constant)."""
+    if version_path is None:
+        return VERSION
+    return _read_version_file(version_path)
+
+
+@lru_cache(maxsize=None)
 def load_schema(schema_path):
-    """Load and validate a JSON schema file."""
+    """Load and validate a JSON schema file (memoised per path)."""
     if not os.path.exists(schema_path):
         raise FileNotFoundError(f"Schema not found at {schema_path}")
-    
+
     with open(schema_path, 'r') as f:
         schema = json.load(f)
-    
+
     # Basic schema validation
     if '$schema' not in schema:
         raise ValueError("Schema missing $schema field")
-    
+
     return schema
 
 
+@lru_cache(maxsize=None)
+def compiled_validator(schema_path):
+    """Compile the schema at ``schema_path`` into a validator callable.
+
+    fastjsonschema code-generates a plain Python function per schema;
+    the jsonschema fallback wraps Draft7Validator.validate. Either way
+    the parse+compile cost is paid once per path, not per event.
+    """
+    schema = load_schema(schema_path)
+    try:
+        import fastjsonschema
+        return fastjsonschema.compile(schema)
+    except ImportError:
+        from jsonschema import Draft7Validator
+        return Draft7Validator(schema).validate
+
+
+# Dominant no-payload case skips the JSON encoder entirely
+EMPTY_PAYLOAD_JSON = '{}'
+
+try:
+    # C encoder, mirroring the processor's DB write path
+    import orjson
+
+    def dumps_payload(payload):
+        """Serialize a job payload for database storage (orjson)."""
+        if not payload:
+            return EMPTY_PAYLOAD_JSON
+        return orjson.dumps(payload).decode()
+except ImportError:
+    def dumps_payload(payload):
+        """Serialize a job payload for database storage."""
+        if not payload:
+            return EMPTY_PAYLOAD_JSON
+        # Compact separators drop the whitespace bytes on the wire
+        return json.dumps(payload, separators=(',', ':'))
+
+
+@lru_cache(maxsize=8)
 def healthz_response(version):
-    """Build health check response with version."""
+    """Build health check response with version.
+
+    Memoised: the response for a given version is immutable, so hot
+    health probes become a dict lookup.
+    """
     return {
         "status": "ok",
         "version": version
@@ -51,13 +122,26 @@ class TestVersionReader:
     def test_read_version_returns_semver(self):
         """read_version() returns SemVer from VERSION file."""
         version = read_version()
-        assert re.match(r'^\d+\.\d+\.\d+$', version), f"Invalid SemVer: {version}"
+        assert SEMVER_RE.match(version), f"Invalid SemVer: {version}"
     
     def test_version_is_0_1_0(self):
         """Version should be 0.1.0 for Phase 10.5."""
         version = read_version()
         assert version == "0.1.0"
 
+    def test_read_version_from_injected_path(self, tmp_path):
+        """read_version(path) works off-repo via an injected file."""
+        version_file = tmp_path / 'VERSION'
+        version_file.write_text('9.8.7')
+        assert read_version(str(version_file)) == '9.8.7'
+
+    def test_read_version_rejects_non_semver(self, tmp_path):
+        """Malformed VERSION content raises ValueError."""
+        version_file = tmp_path / 'VERSION'
+        version_file.write_text('not-a-version')
+        with pytest.raises(ValueError, match="Invalid SemVer"):
+            read_version(str(version_file))
+
 
 class TestHealthResponse:
     """Test health endpoint response."""
@@ -96,53 +180,291 @@ class TestSchemaLoader:
             # Skip if running outside project context
             pytest.skip("Contracts path not available in this test context")
 
+    def test_compiled_validator_is_cached(self):
+        """compiled_validator returns the same callable per path."""
+        contracts_path = os.path.join(
+            os.path.dirname(__file__),
+            '..', '..', '..', '..',
+            'contracts', 'schemas', 'event-envelope.json'
+        )
+
+        if not os.path.exists(contracts_path):
+            pytest.skip("Contracts path not available in this test context")
+
+        validator = compiled_validator(contracts_path)
+        assert callable(validator)
+        assert compiled_validator(contracts_path) is validator
+
+    def test_load_schema_from_injected_path(self, tmp_path):
+        """load_schema(path) works off-repo via an injected file.
+
+        tmp_path gives a unique path per test, so the lru_cache on
+        load_schema never needs clearing between runs.
+        """
+        schema_file = tmp_path / 'thing.json'
+        schema_file.write_text(json.dumps({
+            '$schema': 'http://json-schema.org/draft-07/schema#',
+            'title': 'Thing',
+            'type': 'object',
+        }))
+        schema = load_schema(str(schema_file))
+        assert schema['title'] == 'Thing'
+
 
 # ============================================================
 # Phase 12: State Machine Invariants (G6)
 # ============================================================
 
-# Valid job statuses and allowed transitions
-VALID_STATUSES = {'PENDING', 'PROCESSING', 'COMPLETED', 'FAILED'}
-VALID_TRANSITIONS = {
-    'PENDING': {'PROCESSING'},
-    'PROCESSING': {'COMPLETED', 'FAILED'},
-    'COMPLETED': set(),  # Terminal state
-    'FAILED': set(),     # Terminal state
-}
+# Valid job statuses and allowed transitions, frozen: immutable tables
+# can't drift via accidental mutation and let specializing interpreters
+# treat them as constants. Terminal states share one empty frozenset
+_NO_TRANSITIONS = frozenset()
+VALID_STATUSES = frozenset({'PENDING', 'PROCESSING', 'COMPLETED', 'FAILED'})
+VALID_TRANSITIONS = MappingProxyType({
+    'PENDING': frozenset({'PROCESSING'}),
+    'PROCESSING': frozenset({'COMPLETED', 'FAILED'}),
+    'COMPLETED': _NO_TRANSITIONS,  # Terminal state
+    'FAILED': _NO_TRANSITIONS,     # Terminal state
+})
+
+
+class Status(IntEnum):
+    """Job statuses as small ints for the hot transition path."""
+    PENDING = 0
+    PROCESSING = 1
+    COMPLETED = 2
+    FAILED = 3
+
+
+# String -> Status conversion, applied once at the API boundary
+_STATUS_FROM_STR = {s.name: s for s in Status}
+
+# Transition table indexed by Status value; int membership checks skip
+# string hashing entirely
+_ALLOWED = (
+    frozenset({Status.PROCESSING}),                # PENDING
+    frozenset({Status.COMPLETED, Status.FAILED}),  # PROCESSING
+    frozenset(),                                   # COMPLETED (terminal)
+    frozenset(),                                   # FAILED (terminal)
+)
+
+# Specialized per-state dispatch: maps the target-status string straight
+# to its code, so a legal transition is one dict probe instead of a
+# string->code lookup plus a membership test
+_TRANSITION_TABLE = tuple({t.name: t for t in _ALLOWED[s]} for s in Status)
+
+# Exact-match window for recent event IDs; older IDs fall back to the
+# bloom filter so memory stays bounded on long redelivery streams
+_RECENT_EVENTS_CAP = 1024
+
+
+def _dedup_key(event_id: str):
+    """Compact key for the idempotency stores.
+
+    UUID ids collapse to their 128-bit int — a fraction of the ~85-byte
+    string object, with identity hashing. Non-UUID ids (tests, legacy
+    producers) keep the string itself.
+    """
+    try:
+        return uuid.UUID(event_id).int
+    except ValueError:
+        return event_id
+
+
+class _BloomFilter:
+    """Fixed-size bloom filter over a bytearray (k double-hashed probes)."""
+
+    __slots__ = ('_bits', '_size', '_k')
+
+    def __init__(self, size_bits: int = 1 << 20, k: int = 4):
+        self._bits = bytearray(size_bits // 8)
+        self._size = size_bits
+        self._k = k
+
+    def _indexes(self, item) -> Iterator[int]:
+        # Salted tuple hash gives an independent second hash for both
+        # str and int keys
+        h1 = hash(item)
+        h2 = hash((item, 0x9E3779B9))
+        for i in range(self._k):
+            yield (h1 + i * h2) % self._size
+
+    def add(self, item) -> None:
+        for idx in self._indexes(item):
+            self._bits[idx >> 3] |= 1 << (idx & 7)
+
+    def __contains__(self, item) -> bool:
+        return all(self._bits[idx >> 3] & (1 << (idx & 7)) for idx in self._indexes(item))
 
 
 class JobStateMachine:
     """State machine for job status transitions."""
-    
-    def __init__(self, job_id: str, initial_status: str = 'PENDING'):
-        if initial_status not in VALID_STATUSES:
+
+    # Fixed slots instead of a per-instance __dict__: smaller footprint
+    # and faster attribute access with thousands of live jobs
+    __slots__ = ('job_id', '_status', 'processed_event_ids', '_bloom',
+                 '_dedup_client', '_lock')
+
+    def __init__(self, job_id: str, initial_status: str = 'PENDING',
+                 dedup_client: Optional[Any] = None):
+        status = _STATUS_FROM_STR.get(initial_status)
+        if status is None:
             raise ValueError(f"Invalid initial status: {initial_status}")
         self.job_id = job_id
-        self.status = initial_status
-        self.processed_event_ids = set()
+        self._status = status
+        # Recent IDs stay exact (insertion-ordered dict as a bounded
+        # LRU); evicted IDs move into the constant-memory bloom filter
+        self.processed_event_ids = OrderedDict()
+        self._bloom = _BloomFilter()
+        # Optional shared dedup store (redis-like: sadd returns 0 on a
+        # duplicate member). With one, redeliveries routed to another
+        # consumer instance are still caught; without one, the
+        # per-process LRU+bloom guard applies
+        self._dedup_client = dedup_client
+        # Guards the read-modify-write paths: two worker threads racing
+        # the same redelivered event must not both see it as new
+        self._lock = threading.Lock()
     
-    def transition(self, new_status: str) -> bool:
-        """Attempt status transition. Returns True if valid."""
-        if new_status not in VALID_STATUSES:
+    @property
+    def status(self) -> str:
+        """Current status as its contract string."""
+        return self._status.name
+
+    def transition(self, new_status: str, _table=_TRANSITION_TABLE,
+                   _valid=_STATUS_FROM_STR) -> bool:
+        """Attempt status transition. Returns True if valid.
+
+        The lookup tables are bound as defaults so the hot path uses
+        LOAD_FAST instead of re-resolving module globals.
+        """
+        with self._lock:
+            # Happy path is a single probe into the per-state table
+            code = _table[self._status].get(new_status)
+            if code is not None:
+                self._status = code
+                return True
+        if new_status not in _valid:
             raise ValueError(f"Invalid target status: {new_status}")
-        
-        if new_status in VALID_TRANSITIONS.get(self.status, set()):
-            self.status = new_status
-            return True
         return False
     
     def process_event(self, event_id: str, delivery_tag: int, redelivered: bool) -> str:
         """Process an event, handling idempotency.
-        
+
         Returns: 'processed', 'duplicate', or 'invalid'
+
+        Broker-level dedup (rabbitmq-message-deduplication's
+        x-message-deduplication queue argument) would make most of this
+        redundant, but the stock rabbitmq images in infra/ don't ship
+        the plugin, so the consumer-side guard stays authoritative.
         """
         # V4: Realistic idempotency - same eventId but potentially different delivery metadata
-        if event_id in self.processed_event_ids:
-            # Already processed - idempotent no-op
-            return 'duplicate'
-        
-        self.processed_event_ids.add(event_id)
-        return 'processed'
+        key = _dedup_key(event_id)
+        with self._lock:
+            if key in self._bloom:
+                # Evicted from the exact window but already processed
+                return 'duplicate'
+
+            # Single-probe membership + insert: the length check replaces
+            # a separate `in` test, hashing the key once instead of twice
+            seen = self.processed_event_ids
+            n = len(seen)
+            seen[key] = None
+            if len(seen) == n:
+                # Already processed - idempotent no-op
+                return 'duplicate'
+
+            # Evict before the shared-store verdict: a stream of
+            # cross-instance duplicates still inserts keys above, and
+            # returning early would let the window grow unbounded
+            if len(seen) > _RECENT_EVENTS_CAP:
+                evicted, _ = seen.popitem(last=False)
+                self._bloom.add(evicted)
+
+            if self._dedup_client is not None:
+                # SADD is atomic across workers: 0 means another instance
+                # already claimed this event
+                if not self._dedup_client.sadd(f'job:{self.job_id}:evts', event_id):
+                    return 'duplicate'
+
+            return 'processed'
+
+    def process_events(self, event_ids: Iterable[str]) -> List[str]:
+        """Process a batch of events, returning one status per event.
+
+        A single C-level set difference replaces a membership probe and
+        insert per call, amortizing redelivery bursts.
+        """
+        ids = list(event_ids)
+        keys = [_dedup_key(e) for e in ids]
+        with self._lock:
+            seen = self.processed_event_ids
+            bloom = self._bloom
+            local_new = {k for k in set(keys) - seen.keys() if k not in bloom}
+            new = local_new
+            if local_new and self._dedup_client is not None:
+                # One SADD per first occurrence (a redis client would
+                # pipeline these): 0 means another instance already
+                # claimed the event. Store-rejected keys still land in
+                # `seen` below so later local probes short-circuit,
+                # matching process_event
+                sadd = self._dedup_client.sadd
+                set_key = f'job:{self.job_id}:evts'
+                pending = set(local_new)
+                new = set()
+                for event_id, key in zip(ids, keys):
+                    if key in pending:
+                        pending.discard(key)
+                        if sadd(set_key, event_id):
+                            new.add(key)
+            for key in local_new:
+                seen[key] = None
+            while len(seen) > _RECENT_EVENTS_CAP:
+                evicted, _ = seen.popitem(last=False)
+                bloom.add(evicted)
+        # Only the first occurrence of a key within the batch is new;
+        # repeats in the same call report 'duplicate', matching what
+        # sequential process_event calls would return
+        remaining = set(new)
+        statuses = []
+        for k in keys:
+            if k in remaining:
+                remaining.remove(k)
+                statuses.append('processed')
+            else:
+                statuses.append('duplicate')
+        return statuses
+
+
+class TransitionBuffer:
+    """Buffers status transitions and flushes them as one transaction.
+
+    Per-transition UPDATE+commit bounds throughput at one fsync per
+    event; batching N transitions into a single executemany+commit
+    amortizes that to one fsync per batch.
+    """
+
+    __slots__ = ('_conn', '_buf', '_max_elements')
+
+    def __init__(self, conn: Any, max_elements: int = 100):
+        self._conn = conn
+        self._buf: List[tuple] = []
+        self._max_elements = max_elements
+
+    def add(self, job_id: str, new_status: str) -> None:
+        """Queue a transition; flushes once the batch fills."""
+        self._buf.append((new_status, job_id))
+        if len(self._buf) >= self._max_elements:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered transitions in one transaction."""
+        if not self._buf:
+            return
+        batch, self._buf = self._buf, []
+        cur = self._conn.cursor()
+        cur.executemany('UPDATE jobs SET status=%s WHERE id=%s', batch)
+        self._conn.commit()
+        cur.close()
 
 
 class TestJobStateMachine:
@@ -220,6 +542,70 @@ class TestIdempotency:
         assert result2 == 'processed'
         assert len(job.processed_event_ids) == 2
     
+    def test_shared_dedup_client_catches_cross_instance_duplicate(self):
+        """A shared dedup store deduplicates across consumer instances."""
+        class FakeDedupStore:
+            def __init__(self):
+                self._sets = {}
+
+            def sadd(self, key, member):
+                members = self._sets.setdefault(key, set())
+                if member in members:
+                    return 0
+                members.add(member)
+                return 1
+
+        store = FakeDedupStore()
+        consumer_a = JobStateMachine('job-shared-001', dedup_client=store)
+        consumer_b = JobStateMachine('job-shared-001', dedup_client=store)
+
+        assert consumer_a.process_event('evt-x', delivery_tag=1, redelivered=False) == 'processed'
+        # Redelivery lands on a different instance with empty local state
+        assert consumer_b.process_event('evt-x', delivery_tag=2, redelivered=True) == 'duplicate'
+
+    def test_batch_consults_shared_store_across_instances(self):
+        """process_events registers and checks events in the shared store."""
+        class FakeDedupStore:
+            def __init__(self):
+                self._sets = {}
+
+            def sadd(self, key, member):
+                members = self._sets.setdefault(key, set())
+                if member in members:
+                    return 0
+                members.add(member)
+                return 1
+
+        store = FakeDedupStore()
+        consumer_a = JobStateMachine('job-shared-002', dedup_client=store)
+        consumer_b = JobStateMachine('job-shared-002', dedup_client=store)
+
+        assert consumer_a.process_events(['evt-1', 'evt-2']) == ['processed', 'processed']
+        # Redelivered batch lands on another instance with empty local state
+        assert consumer_b.process_events(['evt-2', 'evt-3']) == ['duplicate', 'processed']
+        # And the batch path claimed its events for sequential consumers
+        consumer_c = JobStateMachine('job-shared-002', dedup_client=store)
+        assert consumer_c.process_event('evt-3', delivery_tag=9, redelivered=True) == 'duplicate'
+
+    def test_batch_mixes_new_and_seen_events(self):
+        """process_events returns per-event verdicts preserving order."""
+        job = JobStateMachine('job-idempotent-004')
+        job.process_event('evt-seen', delivery_tag=1, redelivered=False)
+
+        results = job.process_events(['evt-seen', 'evt-new-1', 'evt-new-2'])
+
+        assert results == ['duplicate', 'processed', 'processed']
+        assert len(job.processed_event_ids) == 3
+
+    def test_batch_repeated_event_id_is_duplicate(self):
+        """A repeat within one batch matches sequential process_event calls."""
+        job = JobStateMachine('job-idempotent-005')
+
+        results = job.process_events(['evt-a', 'evt-b', 'evt-a'])
+
+        assert results == ['processed', 'processed', 'duplicate']
+        assert len(job.processed_event_ids) == 2
+
     def test_redelivery_with_same_delivery_tag_is_duplicate(self):
         """Exact same delivery (same eventId, same deliveryTag) is duplicate."""
         job = JobStateMachine('job-idempotent-003')
@@ -231,6 +617,35 @@ class TestIdempotency:
         assert result == 'duplicate'
 
 
+class TestTransitionBuffer:
+    """Test batched transition flushing (one commit per batch)."""
+
+    def test_flush_writes_batch_in_one_transaction(self):
+        """flush() issues a single executemany and a single commit."""
+        conn = MagicMock()
+        buf = TransitionBuffer(conn, max_elements=100)
+
+        buf.add('job-1', 'PROCESSING')
+        buf.add('job-2', 'COMPLETED')
+        buf.flush()
+
+        conn.cursor.return_value.executemany.assert_called_once_with(
+            'UPDATE jobs SET status=%s WHERE id=%s',
+            [('PROCESSING', 'job-1'), ('COMPLETED', 'job-2')]
+        )
+        conn.commit.assert_called_once()
+
+    def test_add_flushes_at_threshold(self):
+        """Hitting max_elements triggers an automatic flush."""
+        conn = MagicMock()
+        buf = TransitionBuffer(conn, max_elements=2)
+
+        buf.add('job-1', 'PROCESSING')
+        conn.commit.assert_not_called()
+        buf.add('job-2', 'PROCESSING')
+        conn.commit.assert_called_once()
+
+
 class TestMalformedInput:
     """Test handling of malformed input (error shape, not schema)."""
     
@@ -274,7 +689,7 @@ class TestContractCompliance:
         # The processor's extraction logic must not fail
         extracted_payload = job_data.get('payload', {})
         assert extracted_payload == {}
-        assert json.dumps(extracted_payload) == '{}'
+        assert dumps_payload(extracted_payload) == EMPTY_PAYLOAD_JSON
     
     def test_job_with_payload_extracts_correctly(self):
         """Jobs WITH payload still work correctly.
@@ -295,20 +710,20 @@ class TestContractCompliance:
     def test_payload_serialization_empty(self):
         """Empty payload serializes correctly for database storage."""
         job_data = {"id": "test", "type": "test", "status": "PENDING", "createdAt": "2025-01-01T12:00:00Z"}
-        payload_json = json.dumps(job_data.get('payload', {}))
+        payload_json = dumps_payload(job_data.get('payload', {}))
         assert payload_json == '{}'
-    
+
     def test_payload_serialization_with_data(self):
         """Payload with data serializes correctly for database storage."""
         job_data = {
             "id": "test",
-            "type": "test", 
+            "type": "test",
             "status": "PENDING",
             "createdAt": "2025-01-01T12:00:00Z",
             "payload": {"key": "value"}
         }
-        payload_json = json.dumps(job_data.get('payload', {}))
-        assert payload_json == '{"key": "value"}'
+        payload_json = dumps_payload(job_data.get('payload', {}))
+        assert json.loads(payload_json) == {"key": "value"}
 
 
 # ============================================================
@@ -355,29 +770,37 @@ class TestProcessJobSuccess:
     @patch('main.psycopg2')
     @patch('main.validate_message')
     @patch('main.time')
-    @patch('main.uuid')
-    def test_process_job_success_flow(self, mock_uuid, mock_time, mock_validate, mock_pg):
+    @patch('main.UUID_POOL')
+    def test_process_job_success_flow(self, mock_uuid_pool, mock_time, mock_validate, mock_pg):
         """process_job successfully processes a valid message."""
         from main import process_job, JOBS_PROCESSED, JOBS_COMPLETED
-        
+
         # Setup mocks
         mock_validate.return_value = (True, None)
-        mock_uuid.uuid4.return_value = 'new-event-id'
+        mock_uuid_pool.next_hex.return_value = 'new-event-id'
         mock_time.time.return_value = 1000.0
         mock_time.strftime.return_value = '2025-01-01T00:00:00Z'
         mock_time.sleep = Mock()  # Skip actual sleep
         
-        # Mock PostgreSQL
+        # Mock PostgreSQL connection pool
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_pg.connect.return_value = mock_conn
+        mock_pool = MagicMock()
+        mock_pg.pool.ThreadedConnectionPool.return_value = mock_pool
+        mock_pool.getconn.return_value = mock_conn
         mock_conn.cursor.return_value = mock_cursor
-        
-        # Mock RabbitMQ channel
+
+        # Mock RabbitMQ channel; run threadsafe callbacks inline
         mock_channel = MagicMock()
+        mock_channel.connection.add_callback_threadsafe.side_effect = lambda cb: cb()
         mock_method = MagicMock()
-        mock_method.delivery_tag = 123
+        mock_method.delivery_tag = 1
         mock_properties = MagicMock()
+
+        # Single-message batches so the row write and ack flush inline
+        import main
+        main._ACKS = main._AckBatcher(batch_size=1)
+        main._ROWS = main._RowBatcher(batch_size=1)
         
         # Valid message body
         body = json.dumps({
@@ -400,22 +823,326 @@ class TestProcessJobSuccess:
         # Record initial counter values
         initial_processed = JOBS_PROCESSED._value.get()
         initial_completed = JOBS_COMPLETED._value.get()
-        
-        # Execute
-        process_job(mock_channel, mock_method, mock_properties, body)
+
+        # Execute (work runs on the pool; wait for it)
+        process_job(mock_channel, mock_method, mock_properties, body).result(timeout=5)
         
         # Verify
         mock_validate.assert_called_once()
-        mock_pg.connect.assert_called()
-        mock_cursor.execute.assert_called()
+        mock_pg.pool.ThreadedConnectionPool.assert_called_once()
+        mock_pg.extras.execute_values.assert_called_once()
         mock_conn.commit.assert_called()
-        mock_channel.basic_ack.assert_called_once_with(delivery_tag=123)
+        mock_pool.putconn.assert_called_once_with(mock_conn)
+        mock_channel.basic_ack.assert_called_once_with(delivery_tag=1, multiple=True)
         mock_channel.basic_publish.assert_called()  # Completion event
         
-        # Verify metrics incremented
+        # Verify metrics incremented (fold the per-thread shards first)
+        main._flush_metric_shards()
         assert JOBS_PROCESSED._value.get() > initial_processed
         assert JOBS_COMPLETED._value.get() > initial_completed
 
+    @patch('main.psycopg2')
+    @patch('main.validate_message')
+    @patch('main.time')
+    @patch('main.UUID_POOL')
+    def test_acks_batch_into_single_multi_ack(self, mock_uuid_pool, mock_time, mock_validate, mock_pg):
+        """A full batch of completions collapses into one multi-ack frame."""
+        import main
+        from main import process_job, _ACK_BATCH_SIZE
+
+        # Setup mocks
+        mock_validate.return_value = (True, None)
+        mock_uuid_pool.next_hex.return_value = 'new-event-id'
+        mock_time.time.return_value = 1000.0
+        mock_time.strftime.return_value = '2025-01-01T00:00:00Z'
+        mock_time.sleep = Mock()  # Skip actual sleep
+
+        mock_conn = MagicMock()
+        mock_pool = MagicMock()
+        mock_pg.pool.ThreadedConnectionPool.return_value = mock_pool
+        mock_pool.getconn.return_value = mock_conn
+
+        mock_channel = MagicMock()
+        mock_channel.connection.add_callback_threadsafe.side_effect = lambda cb: cb()
+        mock_properties = MagicMock()
+
+        # Rows flush inline so acks reach the batcher deterministically
+        main._ROWS = main._RowBatcher(batch_size=1)
+
+        body = json.dumps({
+            'contractVersion': '1.0.0',
+            'eventType': 'job.created',
+            'eventId': 'evt-batch',
+            'occurredAt': '2025-01-01T00:00:00Z',
+            'correlationId': 'corr-batch',
+            'idempotencyKey': 'idem-batch',
+            'producer': {'service': 'gateway', 'instanceId': 'gw-1', 'version': '0.1.0'},
+            'payload': {
+                'id': '770e8400-e29b-41d4-a716-446655440000',
+                'type': 'compute',
+                'status': 'PENDING',
+                'createdAt': '2025-01-01T00:00:00Z'
+            }
+        }).encode()
+
+        for tag in range(1, _ACK_BATCH_SIZE + 1):
+            method = MagicMock()
+            method.delivery_tag = tag
+            process_job(mock_channel, method, mock_properties, body).result(timeout=5)
+
+        # One frame settles the whole batch
+        mock_channel.basic_ack.assert_called_once_with(
+            delivery_tag=_ACK_BATCH_SIZE, multiple=True
+        )
+
+    @patch('main.psycopg2')
+    @patch('main.validate_message')
+    @patch('main.time')
+    @patch('main.UUID_POOL')
+    def test_rows_batch_into_single_commit(self, mock_uuid_pool, mock_time, mock_validate, mock_pg):
+        """A full row batch writes with one execute_values and one commit."""
+        import main
+        from main import process_job, _ROW_BATCH_SIZE
+
+        # Setup mocks
+        mock_validate.return_value = (True, None)
+        mock_uuid_pool.next_hex.return_value = 'new-event-id'
+        mock_time.time.return_value = 1000.0
+        mock_time.strftime.return_value = '2025-01-01T00:00:00Z'
+        mock_time.sleep = Mock()  # Skip actual sleep
+
+        mock_conn = MagicMock()
+        mock_pool = MagicMock()
+        mock_pg.pool.ThreadedConnectionPool.return_value = mock_pool
+        mock_pool.getconn.return_value = mock_conn
+
+        mock_channel = MagicMock()
+        mock_channel.connection.add_callback_threadsafe.side_effect = lambda cb: cb()
+        mock_properties = MagicMock()
+
+        # Long max age so only the size threshold can trigger the flush
+        main._ROWS = main._RowBatcher(max_age_s=60.0)
+
+        body = json.dumps({
+            'contractVersion': '1.0.0',
+            'eventType': 'job.created',
+            'eventId': 'evt-row-batch',
+            'occurredAt': '2025-01-01T00:00:00Z',
+            'correlationId': 'corr-row-batch',
+            'idempotencyKey': 'idem-row-batch',
+            'producer': {'service': 'gateway', 'instanceId': 'gw-1', 'version': '0.1.0'},
+            'payload': {
+                'id': '880e8400-e29b-41d4-a716-446655440000',
+                'type': 'compute',
+                'status': 'PENDING',
+                'createdAt': '2025-01-01T00:00:00Z'
+            }
+        }).encode()
+
+        for tag in range(1, _ROW_BATCH_SIZE + 1):
+            method = MagicMock()
+            method.delivery_tag = tag
+            process_job(mock_channel, method, mock_properties, body).result(timeout=5)
+
+        # One transaction settles the whole batch
+        mock_pg.extras.execute_values.assert_called_once()
+        mock_conn.commit.assert_called_once()
+        rows = mock_pg.extras.execute_values.call_args.args[2]
+        assert len(rows) == _ROW_BATCH_SIZE
+
+    @patch('main.psycopg2')
+    def test_row_batcher_columns_zip_into_rows(self, mock_pg):
+        """Buffered fields stay columnar and zip into rows at flush."""
+        import main
+        buf = main._RowBatcher(batch_size=200, max_age_s=60.0)
+
+        for i in range(100):
+            buf.add(f'id-{i}', 'compute', '{}', '2025-01-01T00:00:00Z',
+                    lambda ok: None)
+
+        assert len(buf._ids) == 100
+        buf.flush()
+
+        rows = mock_pg.extras.execute_values.call_args.args[2]
+        assert len(rows) == 100
+        assert rows[0] == ('id-0', 'compute', 'COMPLETED', '{}',
+                           '2025-01-01T00:00:00Z')
+
+    @patch('main.psycopg2')
+    @patch('main.validate_message')
+    @patch('main.time')
+    @patch('main.UUID_POOL')
+    def test_duplicate_body_short_circuits_to_ack(self, mock_uuid_pool, mock_time, mock_validate, mock_pg):
+        """A redelivered body skips validate/write/publish and just acks."""
+        import main
+        from main import process_job
+
+        # Setup mocks
+        mock_validate.return_value = (True, None)
+        mock_uuid_pool.next_hex.return_value = 'new-event-id'
+        mock_time.time.return_value = 1000.0
+        mock_time.strftime.return_value = '2025-01-01T00:00:00Z'
+        mock_time.sleep = Mock()  # Skip actual sleep
+
+        mock_conn = MagicMock()
+        mock_pool = MagicMock()
+        mock_pg.pool.ThreadedConnectionPool.return_value = mock_pool
+        mock_pool.getconn.return_value = mock_conn
+
+        mock_channel = MagicMock()
+        mock_channel.connection.add_callback_threadsafe.side_effect = lambda cb: cb()
+        mock_properties = MagicMock()
+
+        # Single-message batches so every step settles inline
+        main._ACKS = main._AckBatcher(batch_size=1)
+        main._ROWS = main._RowBatcher(batch_size=1)
+
+        body = json.dumps({
+            'contractVersion': '1.0.0',
+            'eventType': 'job.created',
+            'eventId': 'evt-redelivered',
+            'occurredAt': '2025-01-01T00:00:00Z',
+            'correlationId': 'corr-redelivered',
+            'idempotencyKey': 'idem-redelivered',
+            'producer': {'service': 'gateway', 'instanceId': 'gw-1', 'version': '0.1.0'},
+            'payload': {
+                'id': '990e8400-e29b-41d4-a716-446655440000',
+                'type': 'compute',
+                'status': 'PENDING',
+                'createdAt': '2025-01-01T00:00:00Z'
+            }
+        }).encode()
+
+        for tag in (1, 2):
+            method = MagicMock()
+            method.delivery_tag = tag
+            process_job(mock_channel, method, mock_properties, body).result(timeout=5)
+
+        # First delivery does the work; the redelivery only acks
+        mock_validate.assert_called_once()
+        mock_pg.extras.execute_values.assert_called_once()
+        assert mock_channel.basic_publish.call_count == 1
+        assert mock_channel.basic_ack.call_count == 2
+
+    @patch('main.psycopg2')
+    @patch('main.validate_message')
+    @patch('main.time')
+    @patch('main.UUID_POOL')
+    def test_unroutable_completion_is_not_marked_seen(self, mock_uuid_pool, mock_time, mock_validate, mock_pg):
+        """A requeued unroutable completion must not short-circuit."""
+        import main
+        import pika
+        from main import process_job
+
+        # Setup mocks
+        mock_validate.return_value = (True, None)
+        mock_uuid_pool.next_hex.return_value = 'new-event-id'
+        mock_time.time.return_value = 1000.0
+        mock_time.strftime.return_value = '2025-01-01T00:00:00Z'
+        mock_time.sleep = Mock()  # Skip actual sleep
+
+        mock_conn = MagicMock()
+        mock_pool = MagicMock()
+        mock_pg.pool.ThreadedConnectionPool.return_value = mock_pool
+        mock_pool.getconn.return_value = mock_conn
+
+        mock_channel = MagicMock()
+        mock_channel.connection.add_callback_threadsafe.side_effect = lambda cb: cb()
+        mock_properties = MagicMock()
+
+        # First completion publish is unroutable, the redelivery's succeeds
+        mock_channel.basic_publish.side_effect = [
+            pika.exceptions.UnroutableError('unroutable'), None]
+
+        # Single-message batches so every step settles inline
+        main._ACKS = main._AckBatcher(batch_size=1)
+        main._ROWS = main._RowBatcher(batch_size=1)
+
+        body = json.dumps({
+            'contractVersion': '1.0.0',
+            'eventType': 'job.created',
+            'eventId': 'evt-unroutable',
+            'occurredAt': '2025-01-01T00:00:00Z',
+            'correlationId': 'corr-unroutable',
+            'idempotencyKey': 'idem-unroutable',
+            'producer': {'service': 'gateway', 'instanceId': 'gw-1', 'version': '0.1.0'},
+            'payload': {
+                'id': 'aa0e8400-e29b-41d4-a716-446655440000',
+                'type': 'compute',
+                'status': 'PENDING',
+                'createdAt': '2025-01-01T00:00:00Z'
+            }
+        }).encode()
+
+        for tag in (1, 2):
+            method = MagicMock()
+            method.delivery_tag = tag
+            process_job(mock_channel, method, mock_properties, body).result(timeout=5)
+
+        # The unroutable first delivery is requeued, not marked seen
+        mock_channel.basic_nack.assert_called_once_with(delivery_tag=1, requeue=True)
+        # So the redelivery redoes the write and publish instead of a bare ack
+        assert mock_pg.extras.execute_values.call_count == 2
+        assert mock_channel.basic_publish.call_count == 2
+        mock_channel.basic_ack.assert_called_once_with(delivery_tag=2, multiple=True)
+
+    @patch('main.psycopg2')
+    @patch('main.validate_message')
+    @patch('main.time')
+    @patch('main.UUID_POOL')
+    def test_nacked_confirm_requeues_without_killing_consumer(self, mock_uuid_pool, mock_time, mock_validate, mock_pg):
+        """A negative publisher confirm requeues instead of raising."""
+        import main
+        import pika
+        from main import process_job
+
+        # Setup mocks
+        mock_validate.return_value = (True, None)
+        mock_uuid_pool.next_hex.return_value = 'new-event-id'
+        mock_time.time.return_value = 1000.0
+        mock_time.strftime.return_value = '2025-01-01T00:00:00Z'
+        mock_time.sleep = Mock()  # Skip actual sleep
+
+        mock_conn = MagicMock()
+        mock_pool = MagicMock()
+        mock_pg.pool.ThreadedConnectionPool.return_value = mock_pool
+        mock_pool.getconn.return_value = mock_conn
+
+        mock_channel = MagicMock()
+        mock_channel.connection.add_callback_threadsafe.side_effect = lambda cb: cb()
+        mock_properties = MagicMock()
+
+        # Broker nacks the confirm (e.g. queue overflow with reject-publish)
+        mock_channel.basic_publish.side_effect = pika.exceptions.NackError('nacked')
+
+        # Single-message batches so every step settles inline
+        main._ACKS = main._AckBatcher(batch_size=1)
+        main._ROWS = main._RowBatcher(batch_size=1)
+
+        body = json.dumps({
+            'contractVersion': '1.0.0',
+            'eventType': 'job.created',
+            'eventId': 'evt-nacked',
+            'occurredAt': '2025-01-01T00:00:00Z',
+            'correlationId': 'corr-nacked',
+            'idempotencyKey': 'idem-nacked',
+            'producer': {'service': 'gateway', 'instanceId': 'gw-1', 'version': '0.1.0'},
+            'payload': {
+                'id': 'bb0e8400-e29b-41d4-a716-446655440000',
+                'type': 'compute',
+                'status': 'PENDING',
+                'createdAt': '2025-01-01T00:00:00Z'
+            }
+        }).encode()
+
+        method = MagicMock()
+        method.delivery_tag = 1
+        # Must not raise out of the threadsafe callback
+        process_job(mock_channel, method, mock_properties, body).result(timeout=5)
+
+        mock_channel.basic_nack.assert_called_once_with(delivery_tag=1, requeue=True)
+        mock_channel.basic_ack.assert_not_called()
+
 
 class TestProcessJobValidationFailure:
     """Test validation failure path with DLQ routing."""
@@ -432,8 +1159,9 @@ class TestProcessJobValidationFailure:
         mock_time.strftime.return_value = '2025-01-01T00:00:00Z'
         mock_time.time.return_value = 1000.0
         
-        # Mock channel
+        # Mock channel; run threadsafe callbacks inline
         mock_channel = MagicMock()
+        mock_channel.connection.add_callback_threadsafe.side_effect = lambda cb: cb()
         mock_method = MagicMock()
         mock_method.delivery_tag = 456
         mock_properties = MagicMock()
@@ -446,10 +1174,10 @@ class TestProcessJobValidationFailure:
         
         # Record initial counter
         initial_validation_failed = JOBS_VALIDATION_FAILED._value.get()
-        
-        # Execute
-        process_job(mock_channel, mock_method, mock_properties, body)
-        
+
+        # Execute (work runs on the pool; wait for it)
+        process_job(mock_channel, mock_method, mock_properties, body).result(timeout=5)
+
         # Verify DLQ publish
         mock_channel.basic_publish.assert_called_once()
         call_args = mock_channel.basic_publish.call_args
@@ -462,6 +1190,8 @@ class TestProcessJobValidationFailure:
         )
         
         # Verify metric
+        import main
+        main._flush_metric_shards()
         assert JOBS_VALIDATION_FAILED._value.get() > initial_validation_failed
 
 
@@ -472,8 +1202,9 @@ class TestProcessJobJsonError:
         """process_job nacks messages with invalid JSON."""
         from main import process_job, JOBS_VALIDATION_FAILED
         
-        # Mock channel
+        # Mock channel; run threadsafe callbacks inline
         mock_channel = MagicMock()
+        mock_channel.connection.add_callback_threadsafe.side_effect = lambda cb: cb()
         mock_method = MagicMock()
         mock_method.delivery_tag = 789
         mock_properties = MagicMock()
@@ -483,10 +1214,10 @@ class TestProcessJobJsonError:
         
         # Record initial counter
         initial_validation_failed = JOBS_VALIDATION_FAILED._value.get()
-        
-        # Execute
-        process_job(mock_channel, mock_method, mock_properties, body)
-        
+
+        # Execute (work runs on the pool; wait for it)
+        process_job(mock_channel, mock_method, mock_properties, body).result(timeout=5)
+
         # Verify nack without requeue
         mock_channel.basic_nack.assert_called_once_with(
             delivery_tag=789,
@@ -494,6 +1225,8 @@ class TestProcessJobJsonError:
         )
         
         # Verify metric
+        import main
+        main._flush_metric_shards()
         assert JOBS_VALIDATION_FAILED._value.get() > initial_validation_failed
 
 
@@ -510,13 +1243,18 @@ class TestProcessJobExceptionHandling:
         # Setup mocks
         mock_validate.return_value = (True, None)
         mock_time.time.return_value = 1000.0
-        mock_pg.connect.side_effect = Exception("Database connection refused")
-        
-        # Mock channel
+        mock_pg.pool.ThreadedConnectionPool.side_effect = Exception("Database connection refused")
+
+        # Mock channel; run threadsafe callbacks inline
         mock_channel = MagicMock()
+        mock_channel.connection.add_callback_threadsafe.side_effect = lambda cb: cb()
         mock_method = MagicMock()
         mock_method.delivery_tag = 999
         mock_properties = MagicMock()
+
+        # Single-row batch so the failing write happens inline
+        import main
+        main._ROWS = main._RowBatcher(batch_size=1)
         
         # Valid message
         body = json.dumps({
@@ -537,10 +1275,10 @@ class TestProcessJobExceptionHandling:
         
         # Record initial counter
         initial_failed = JOBS_FAILED._value.get()
-        
-        # Execute
-        process_job(mock_channel, mock_method, mock_properties, body)
-        
+
+        # Execute (work runs on the pool; wait for it)
+        process_job(mock_channel, mock_method, mock_properties, body).result(timeout=5)
+
         # Verify nack WITH requeue
         mock_channel.basic_nack.assert_called_once_with(
             delivery_tag=999,
@@ -548,6 +1286,7 @@ class TestProcessJobExceptionHandling:
         )
         
         # Verify metric
+        main._flush_metric_shards()
         assert JOBS_FAILED._value.get() > initial_failed
 
 
@@ -557,8 +1296,8 @@ class TestVersionLoading:
     def test_service_version_is_valid_semver(self):
         """SERVICE_VERSION is loaded and valid SemVer."""
         from main import SERVICE_VERSION
-        
-        assert re.match(r'^\d+\.\d+\.\d+$', SERVICE_VERSION)
+
+        assert SEMVER_RE.match(SERVICE_VERSION)
     
     def test_version_path_constant_exists(self):
         """VERSION_PATH constant points to VERSION file."""
@@ -571,11 +1310,12 @@ class TestVersionLoading:
 class TestMainStartup:
     """Test main() function startup sequence."""
     
+    @patch('main.validate_message')
     @patch('main.pika')
     @patch('main.psycopg2')
     @patch('main.prom')
     @patch('main.time')
-    def test_main_initializes_correctly(self, mock_time, mock_prom, mock_pg, mock_pika):
+    def test_main_initializes_correctly(self, mock_time, mock_prom, mock_pg, mock_pika, mock_validate):
         """main() sets up metrics server, DB, and RabbitMQ correctly."""
         from main import main, QUEUE_NAME, OUT_QUEUE, DLQ_NAME
         
@@ -611,6 +1351,12 @@ class TestMainStartup:
         mock_pg.connect.assert_called()
         mock_cursor.execute.assert_called()
         mock_conn.commit.assert_called()
+
+        # Verify the shared pool is constructed exactly once at startup,
+        # with relaxed synchronous_commit on its connections
+        mock_pg.pool.ThreadedConnectionPool.assert_called_once()
+        pool_kwargs = mock_pg.pool.ThreadedConnectionPool.call_args.kwargs
+        assert pool_kwargs['options'] == '-c synchronous_commit=off'
         
         # Verify queue declarations
         queue_declare_calls = mock_channel.queue_declare.call_args_list
@@ -619,6 +1365,13 @@ class TestMainStartup:
         assert OUT_QUEUE in declared_queues
         assert DLQ_NAME in declared_queues
         
+        # Verify publisher confirms are enabled once at setup
+        mock_channel.confirm_delivery.assert_called_once()
+
+        # Verify the validator was warmed before consuming started
+        mock_validate.assert_called()
+
         # Verify consumer registration
+        from main import PREFETCH_COUNT
         mock_channel.basic_consume.assert_called_once()
-        mock_channel.basic_qos.assert_called_once_with(prefetch_count=1)
+        mock_channel.basic_qos.assert_called_once_with(prefetch_count=PREFETCH_COUNT)
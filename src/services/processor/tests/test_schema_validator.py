@@ -103,6 +103,13 @@ class TestSchemaValidator:
         assert error is not None
         assert "payload" in error.lower()
 
+    def test_validator_compiled_once_and_shared(self, validator):
+        """The compiled envelope validator is built once and reused."""
+        first = validator._get_validator('event-envelope')
+        assert validator._get_validator('event-envelope') is first
+        # A fresh instance reuses the module-level compiled cache
+        assert SchemaValidator()._get_validator('event-envelope') is first
+
 
 class TestValidateMessageFunction:
     """Tests for the convenience validate_message function."""